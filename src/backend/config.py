@@ -1,26 +1,29 @@
 import os
+import sys
 from pathlib import Path
 
-import yaml
-
 current_file = Path(__file__).resolve()
 backend_dir = current_file.parent
 src_dir = backend_dir.parent
 project_root = src_dir.parent
-config_yaml_path = project_root / "config.yaml"
 
 try:
-    with open(config_yaml_path, "r") as f:
-        config = yaml.safe_load(f)
+    if str(src_dir) not in sys.path:
+        sys.path.append(str(src_dir))
+    from common.config import load_config
 except Exception as e:
-    print(f"Error loading config.yaml: {e}")
+    print(f"Error importing shared config loader: {e}")
     raise
 
+config = load_config()
+
 
 # Request parameters
 REQUEST_INTERVAL = int(config.get("request_interval", 1))
 REQUEST_TIMEOUT = int(config.get("request_timeout", 10))
 MAX_RETRIES = int(config.get("max_retries", 3))
+GEOCODE_WORKERS = int(config.get("geocode_workers", 4))
+LLM_WORKERS = int(config.get("llm_workers", 4))
 CONTACT_INFO = os.getenv("CONTACT_INFO")
 
 
@@ -1,27 +1,55 @@
-import copy
-import json
-import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
+import orjson
 import requests
 
 try:
     from . import config
     from .utils import (CoordinateEntry, NewsCoordinate, NewsItem, NewsPOI,
-                        NewsStatus, cache_manager, json_manager, logger)
+                        NewsStatus, RateLimiter, build_session, cache_manager,
+                        json_manager, logger, response_cache)
 except ImportError:
     import config
     from utils import (CoordinateEntry, NewsCoordinate, NewsItem, NewsPOI,
-                       NewsStatus, cache_manager, json_manager, logger)
+                       NewsStatus, RateLimiter, build_session, cache_manager,
+                       json_manager, logger, response_cache)
+
+
+# Paces all Nominatim calls at one per REQUEST_INTERVAL across workers.
+_rate_limiter = RateLimiter(config.REQUEST_INTERVAL)
+
+
+def _build_param_templates(param_fallback: tuple) -> tuple:
+    """
+    Precomputes, for every combination of present POI fields (4-bit mask
+    over country/state/city/amenity), the distinct non-empty key tuples
+    from param_fallback in priority order.
+    """
+    fields = ("country", "state", "city", "amenity")
+    templates = list()
+    for mask in range(16):
+        present = {f for i, f in enumerate(fields) if mask & (1 << i)}
+        plans = list()
+        for fallback in param_fallback:
+            keys = tuple(k for k in fallback if k in present)
+            if keys and keys not in plans:
+                plans.append(keys)
+        templates.append(tuple(plans))
+    return tuple(templates)
 
 
 class CoordinateCoder:
 
     BASE_URL = "https://nominatim.openstreetmap.org/search?"
     HEADERS = {"User-Agent": f"WorldNewsMapBot/1.0 ({config.CONTACT_INFO})"}
+    SESSION = build_session(HEADERS)
     REQUEST_PARAMS = {"dedupe": 1, "format": "jsonv2"}
-    IGNORED_POSITIONS = {"outer space", "cyberspace"}
+    # Constant part of every search URL, encoded once.
+    BASE_QUERY_URL = BASE_URL + urlencode(REQUEST_PARAMS) + "&"
+    IGNORED_POSITIONS = frozenset({"outer space", "cyberspace"})
     PARAM_FALLBACK = (
         ("country", "state", "city", "amenity"),
         ("country", "state", "city"),
@@ -30,29 +58,23 @@ class CoordinateCoder:
         ("state",),
         ("country",),
     )
+    MASK_FIELDS = ("country", "state", "city", "amenity")
+    PARAM_TEMPLATES = _build_param_templates(PARAM_FALLBACK)
 
     def __init__(
         self,
-        date: str = datetime.now().strftime("%Y-%m-%d"),
+        date: str | None = None,
         force_refresh: bool = False,
     ):
         self.force_refresh = force_refresh
-        self.date = date
+        # Resolved at construction, not import: a default argument would be
+        # frozen at module-load time and go stale after midnight.
+        self.date = date if date is not None else datetime.now().strftime(
+            "%Y-%m-%d")
 
     def get_news_list(self) -> None:
-        self.news_list = copy.deepcopy(json_manager.read_news_items(self.date))
-
-    def generate_fallback_poi(self, poi: NewsPOI) -> list[NewsPOI]:
-        fallback_poi_list = list()
-        for params in self.PARAM_FALLBACK:
-            fallback_poi = NewsPOI(
-                country=poi.country if "country" in params else None,
-                state=poi.state if "state" in params else None,
-                city=poi.city if "city" in params else None,
-                institution=poi.institution if "amenity" in params else None,
-            )
-            fallback_poi_list.append(fallback_poi)
-        return fallback_poi_list
+        # read_news_items decodes fresh objects from JSON; no copy needed.
+        self.news_list = json_manager.read_news_items(self.date)
 
     def request_for_coordinates(self, news_item: NewsItem) -> None:
         if news_item.status not in (
@@ -68,7 +90,7 @@ class CoordinateCoder:
         ):
             return
 
-        if news_item.poi.country and news_item.poi.country.lower() in self.IGNORED_POSITIONS:
+        if news_item.poi.country and news_item.poi.country.casefold() in self.IGNORED_POSITIONS:
             logger.debug(
                 f"News item '{news_item.description[:config.LOG_DESCRIPTION_MAX_LENGTH]}...' has an ignored position '{news_item.poi.country}'. Marking as NO_VALID_COORDINATE."
             )
@@ -87,8 +109,9 @@ class CoordinateCoder:
         return
 
     def write_cache(self, poi: NewsPOI, coordinate: NewsCoordinate) -> None:
-        entry = CoordinateEntry(copy.deepcopy(
-            poi), copy.deepcopy(coordinate), datetime.now())
+        # poi and coordinate are built fresh per query and never mutated
+        # afterwards, so the cache can hold them directly.
+        entry = CoordinateEntry(poi, coordinate, datetime.now())
         cache_manager.insert_entry(entry, self.force_refresh)
 
     def query_cache(self, poi: NewsPOI) -> NewsCoordinate | None:
@@ -98,87 +121,111 @@ class CoordinateCoder:
                 return cached_coordinate
         return None
 
+    def _http_get_json(self, url: str) -> tuple[list, bool]:
+        if not self.force_refresh:
+            cached_data = response_cache.get(url)
+            if cached_data is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"URL cache hit for {url}")
+                return cached_data, True
+        _rate_limiter.acquire()
+        response = self.SESSION.get(url, timeout=config.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        response_cache.set(url, data)
+        return data, False
+
     def query(self, poi: NewsPOI) -> NewsCoordinate:
+        # Full-POI cache hit: skip building the fallback plan entirely.
+        cached_coordinate = self.query_cache(poi)
+        if cached_coordinate:
+            return cached_coordinate
+
         param_mapping = {
             "country": poi.country,
             "state": poi.state,
             "city": poi.city,
             "amenity": poi.institution,
         }
-        structed_params = [
-            {k: param_mapping[k] for k in fallback if param_mapping[k]}
-            for fallback in self.PARAM_FALLBACK
-        ]
-        free_form_params = [
-            [param_mapping[k] for k in fallback if param_mapping[k]]
-            for fallback in self.PARAM_FALLBACK
-        ]
         null_coordinate = NewsCoordinate(latitude=-1, longitude=-1)
 
-        fallback_poi_list = self.generate_fallback_poi(poi)
+        # The set of distinct, non-empty fallbacks depends only on which POI
+        # fields are present, so pick the precomputed plan by field mask
+        # instead of rebuilding and deduplicating the param sets per call.
+        mask = 0
+        for i, key in enumerate(self.MASK_FIELDS):
+            if param_mapping[key]:
+                mask |= 1 << i
 
-        for structed_param_set, free_form_param_set, fallback_poi in zip(
-            structed_params, free_form_params, fallback_poi_list
-        ):
+        # URLs are encoded once per plan entry; free-form queries can repeat
+        # across entries when different fields hold the same value, so any
+        # URL already planned is dropped rather than issued twice.
+        issued_urls = set()
+        query_plan = list()
+        for keys in self.PARAM_TEMPLATES[mask]:
+            structed_param_set = {k: param_mapping[k] for k in keys}
+            free_form_param_set = [param_mapping[k] for k in keys]
+            structed_url = self.BASE_QUERY_URL + urlencode(structed_param_set)
+            free_form_url = (
+                self.BASE_QUERY_URL
+                + "q=" + quote_plus(" ".join(free_form_param_set))
+            )
+            if structed_url in issued_urls:
+                structed_url = None
+            else:
+                issued_urls.add(structed_url)
+            if free_form_url in issued_urls:
+                free_form_url = None
+            else:
+                issued_urls.add(free_form_url)
+            fallback_poi = NewsPOI(
+                country=param_mapping["country"] if "country" in keys else None,
+                state=param_mapping["state"] if "state" in keys else None,
+                city=param_mapping["city"] if "city" in keys else None,
+                institution=param_mapping["amenity"] if "amenity" in keys else None,
+            )
+            query_plan.append(
+                (structed_param_set, free_form_param_set,
+                 structed_url, free_form_url, fallback_poi))
+
+        for plan_index, (structed_param_set, free_form_param_set, structed_url,
+                         free_form_url, fallback_poi) in enumerate(query_plan):
             try:
                 cached_coordinate = self.query_cache(fallback_poi)
                 if cached_coordinate:
                     return cached_coordinate
-                if not structed_param_set:
-                    continue
 
-                logger.debug(
-                    f"Querying coordinates with structured params: {structed_param_set}"
-                )
-                structed_response = requests.get(
-                    self.BASE_URL
-                    + urlencode({**self.REQUEST_PARAMS, **structed_param_set}),
-                    headers=self.HEADERS,
-                    timeout=config.REQUEST_TIMEOUT,
-                )
-                structed_response.raise_for_status()
-                structed_data = structed_response.json()
-                if (len(structed_data) == 1 or len({item.get("importance") for item in structed_data}) == 1
-                        or (len(structed_data) == 2 and {item.get("osm_type") for item in structed_data} == {"relation", "node"})):
-                    current_coordinate = NewsCoordinate(
-                        latitude=float(structed_data[0].get("lat", -1)),
-                        longitude=float(structed_data[0].get("lon", -1)),
-                    )
-                    for previous_fallback in fallback_poi_list:
-                        self.write_cache(previous_fallback, current_coordinate)
-                        if previous_fallback == fallback_poi:
-                            break
-                    return current_coordinate
-                time.sleep(config.REQUEST_INTERVAL)
-
-                logger.debug(
-                    f"Querying coordinates with free-form params: {free_form_param_set}"
-                )
-                free_form_response = requests.get(
-                    self.BASE_URL
-                    + urlencode(
-                        {
-                            **self.REQUEST_PARAMS,
-                            "q": " ".join(filter(None, free_form_param_set)),
-                        }
-                    ),
-                    headers=self.HEADERS,
-                    timeout=config.REQUEST_TIMEOUT,
-                )
-                free_form_response.raise_for_status()
-                free_form_data = free_form_response.json()
-                if (len(free_form_data) == 1 or len({item.get("importance") for item in free_form_data}) == 1
-                        or (len(free_form_data) == 2 and {item.get("osm_type") for item in free_form_data} == {"relation", "node"})):
-                    current_coordinate = NewsCoordinate(
-                        latitude=float(free_form_data[0].get("lat", -1)),
-                        longitude=float(free_form_data[0].get("lon", -1)),
-                    )
-                    for previous_fallback in fallback_poi_list:
-                        self.write_cache(previous_fallback, current_coordinate)
-                        if previous_fallback == fallback_poi:
-                            break
-                    return current_coordinate
-                time.sleep(config.REQUEST_INTERVAL)
+                if structed_url:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Querying coordinates with structured params: {structed_param_set}"
+                        )
+                    structed_data, _ = self._http_get_json(structed_url)
+                    if (len(structed_data) == 1 or len({item.get("importance") for item in structed_data}) == 1
+                            or (len(structed_data) == 2 and {item.get("osm_type") for item in structed_data} == {"relation", "node"})):
+                        current_coordinate = NewsCoordinate(
+                            latitude=float(structed_data[0].get("lat", -1)),
+                            longitude=float(structed_data[0].get("lon", -1)),
+                        )
+                        for plan_entry in query_plan[:plan_index + 1]:
+                            self.write_cache(plan_entry[-1], current_coordinate)
+                        return current_coordinate
+
+                if free_form_url:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Querying coordinates with free-form params: {free_form_param_set}"
+                        )
+                    free_form_data, _ = self._http_get_json(free_form_url)
+                    if (len(free_form_data) == 1 or len({item.get("importance") for item in free_form_data}) == 1
+                            or (len(free_form_data) == 2 and {item.get("osm_type") for item in free_form_data} == {"relation", "node"})):
+                        current_coordinate = NewsCoordinate(
+                            latitude=float(free_form_data[0].get("lat", -1)),
+                            longitude=float(free_form_data[0].get("lon", -1)),
+                        )
+                        for plan_entry in query_plan[:plan_index + 1]:
+                            self.write_cache(plan_entry[-1], current_coordinate)
+                        return current_coordinate
 
             except requests.exceptions.Timeout:
                 logger.error(
@@ -192,7 +239,7 @@ class CoordinateCoder:
                 logger.error(
                     f"Request error while fetching coordinates: {e}"
                 )
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(
                     f"JSON decode error while fetching coordinates: {e}"
                 )
@@ -205,12 +252,20 @@ class CoordinateCoder:
         return null_coordinate
 
     def fetch_coordinates(self) -> None:
-        for i, news_item in enumerate(self.news_list):
+        def process(index: int, news_item: NewsItem) -> None:
             logger.info(
-                f"Processing news item {i + 1}/{len(self.news_list)}: '{news_item.description[:config.LOG_DESCRIPTION_MAX_LENGTH]}...'"
+                f"Processing news item {index + 1}/{len(self.news_list)}: '{news_item.description[:config.LOG_DESCRIPTION_MAX_LENGTH]}...'"
             )
             self.request_for_coordinates(news_item)
 
+        with ThreadPoolExecutor(max_workers=config.GEOCODE_WORKERS) as executor:
+            futures = [
+                executor.submit(process, i, news_item)
+                for i, news_item in enumerate(self.news_list)
+            ]
+            for future in futures:
+                future.result()
+
     def save_json(self) -> None:
         json_manager.write_news_items(self.news_list, self.date)
 
@@ -219,6 +274,8 @@ class CoordinateCoder:
         self.get_news_list()
         self.fetch_coordinates()
         self.save_json()
+        cache_manager.save_cache()
+        response_cache.save_cache()
         logger.info(f"Finished coordinate fetch for date: {self.date}")
 
 
@@ -243,6 +300,9 @@ def refresh_weekly_coordinates():
         if coder is not None:
             coder.save_json()
     finally:
+        cache_manager.save_cache()
+        response_cache.save_cache()
+        CoordinateCoder.SESSION.close()
         coder = None
 
 
@@ -1,21 +1,39 @@
-import copy
 from datetime import datetime, timedelta
 
 import requests
-from lxml import html
+from lxml import etree, html
 
 try:
     from . import config
-    from .utils import NewsItem, NewsLink, NewsStatus, json_manager, logger
+    from .utils import (NewsItem, NewsLink, NewsStatus, build_session,
+                        json_manager, logger)
 except ImportError:
     import config
-    from utils import NewsItem, NewsLink, NewsStatus, json_manager, logger
+    from utils import (NewsItem, NewsLink, NewsStatus, build_session,
+                       json_manager, logger)
+
+
+# XPath expressions compiled once; .xpath(str) would recompile them for
+# every element over a week's refresh. The item selector pushes the date
+# filter down into libxml2, so the tree is walked once per date instead of
+# block-by-block with separate date and item passes.
+_XP_ITEMS_FOR_DATE = etree.XPath(
+    '//div[@class="p-current-events-events"]'
+    '//div[@class="current-events-main vevent"]'
+    '[.//span[@class="bday dtstart published updated itvstart" and text()=$date]]'
+    '//div[@class="current-events-content description"]//li[not(.//li)]'
+)
+_XP_LINKS = etree.XPath('.//a[@rel="nofollow"]')
+_XP_DESCRIPTION_TEXT = etree.XPath(
+    "descendant::text()[not(ancestor::a[@rel='nofollow'])]"
+)
 
 
 class WikiNewsScraper:
 
     BASE_URL = "https://en.wikipedia.org/w/api.php?action=parse&format=json&page=Portal:Current%20events&prop=text&formatversion=2"
     HEADERS = {"User-Agent": f"WorldNewsMapBot/1.0 ({config.CONTACT_INFO})"}
+    SESSION = build_session(HEADERS)
 
     def __init__(
         self,
@@ -25,13 +43,14 @@ class WikiNewsScraper:
 
     def fetch_news(self) -> bool:
         try:
-            response = requests.get(
-                self.BASE_URL, headers=self.HEADERS, timeout=config.REQUEST_TIMEOUT
+            response = self.SESSION.get(
+                self.BASE_URL, timeout=config.REQUEST_TIMEOUT
             )
             response.raise_for_status()
             logger.info("Successfully fetched news.")
             self.tree = html.fromstring(response.json().get(
                 "parse", {}).get("text", ""))
+            return True
 
         except requests.exceptions.Timeout:
             logger.error("Request timeout while fetching news.")
@@ -42,58 +61,55 @@ class WikiNewsScraper:
         except Exception as e:
             logger.error(
                 f"Unexpected error while fetching news: {e}", exc_info=True)
-        finally:
-            if not hasattr(self, "tree"):
-                return False
-            return True
+        return False
 
     def parse_news(self, date: str) -> None:
-        event_blocks = self.tree.xpath(
-            '//div[@class="p-current-events-events"]//div[@class="current-events-main vevent"]'
-        )
+        item_elements = _XP_ITEMS_FOR_DATE(self.tree, date=date)
 
-        for event_block in event_blocks:
+        for item_element in item_elements:
             try:
-                date_text = event_block.xpath(
-                    './/span[@class="bday dtstart published updated itvstart"]/text()'
-                )[0]
-                if date_text != date:
+                description, links = self.extract_data(item_element)
+                if not description:
+                    continue
+
+                key = (date, description)
+                if key in self._seen:
                     continue
-                item_elements = event_block.xpath(
-                    './/div[@class="current-events-content description"]//li[not(.//li)]'
+
+                current_news_item = NewsItem(
+                    status=NewsStatus.FETCHED,
+                    date=date,
+                    description=description,
+                    links=links,
                 )
-                for item_element in item_elements:
-                    description, links = self.extract_data(item_element)
-                    if not description:
+
+                # Candidate similar items share a source URL, so look them
+                # up through the URL index instead of scanning the whole
+                # list per item.
+                repetitive = False
+                for link in current_news_item.links:
+                    i = self._url_index.get(link.url)
+                    if i is None:
                         continue
+                    existing_item = self.news_list[i]
+                    if existing_item.is_similar(current_news_item):
+                        self._seen.discard(
+                            (existing_item.date, existing_item.description))
+                        self._unindex_links(existing_item.links, i)
+                        existing_item.description = current_news_item.description
+                        existing_item.links = current_news_item.links
+                        self._index_links(existing_item.links, i)
+                        self._seen.add(key)
+                        repetitive = True
+                        break
+                if not repetitive:
+                    self.news_list.append(current_news_item)
+                    self._index_links(
+                        current_news_item.links, len(self.news_list) - 1)
+                    self._seen.add(key)
 
-                    current_news_item = NewsItem(
-                        status=NewsStatus.FETCHED,
-                        date=date_text,
-                        description=description,
-                        links=links,
-                    )
-
-                    repetitive = False
-                    for i, existing_item in enumerate(self.news_list):
-                        if existing_item == current_news_item:
-                            repetitive = True
-                            break
-                        if existing_item.is_similar(current_news_item):
-                            self.news_list[i].description = current_news_item.description
-                            self.news_list[i].links = current_news_item.links
-                            repetitive = True
-                            break
-                    if not repetitive:
-                        self.news_list.append(current_news_item)
-
-            except IndexError:
-                logger.warning(
-                    "Missing expected date element in event block, skipping."
-                )
-                continue
             except Exception as e:
-                logger.warning(f"Error parsing event block: {e}")
+                logger.warning(f"Error parsing event item: {e}")
                 continue
 
         logger.info(
@@ -102,29 +118,26 @@ class WikiNewsScraper:
     def extract_data(
         self, item_element: html.HtmlElement
     ) -> tuple[str, list[NewsLink]]:
-        link_nodes = item_element.xpath('.//a[@rel="nofollow"]')
+        link_nodes = _XP_LINKS(item_element)
         links = list()
-        total_link_chars = 0
-        link_count = 0
         for link_node in link_nodes:
-            link_text = link_node.text_content()
-            total_link_chars += len(link_text)
-            total_link_chars += link_count
-            link_count += 1
-            link_text = link_text.strip()
+            link_text = link_node.text_content().strip()
             url = link_node.get("href")
             links.append(NewsLink(link_text, url))
 
-        full_text = "".join(item_element.itertext())
-        description = full_text[:-total_link_chars].strip()
-        return description, copy.deepcopy(links)
+        # Exclude source-link text in XPath instead of slicing it off the
+        # tail by character count, which miscounted separators and returned
+        # an empty description for items without links.
+        description = "".join(_XP_DESCRIPTION_TEXT(item_element)).strip()
+        # links is a freshly built local list that is never aliased, so
+        # handing it over directly is safe; deepcopy here only burned CPU.
+        return description, links
 
     def get_news_list(self, date: str) -> None:
         if not self.force_refresh:
             logger.info(
                 f"Attempting to read existing news items for {date}.")
-            self.news_list = copy.deepcopy(
-                json_manager.read_news_items(date))
+            self.news_list = json_manager.read_news_items(date)
             if self.news_list:
                 logger.info(
                     f"Found {len(self.news_list)} existing news items for {date}."
@@ -134,6 +147,22 @@ class WikiNewsScraper:
                 f"Force refresh enabled, ignoring existing news items for {date}."
             )
             self.news_list = list()
+        # (date, description) keys for O(1) exact-duplicate checks while parsing.
+        self._seen = {(item.date, item.description)
+                      for item in self.news_list}
+        # Link URL -> news_list index, for O(1) similar-item candidate lookup.
+        self._url_index = dict()
+        for i, item in enumerate(self.news_list):
+            self._index_links(item.links, i)
+
+    def _index_links(self, links: list[NewsLink], index: int) -> None:
+        for link in links:
+            self._url_index.setdefault(link.url, index)
+
+    def _unindex_links(self, links: list[NewsLink], index: int) -> None:
+        for link in links:
+            if self._url_index.get(link.url) == index:
+                del self._url_index[link.url]
 
     def save_json(self, date: str) -> None:
         json_manager.write_news_items(self.news_list, date)
@@ -169,6 +198,8 @@ def refresh_weekly_news():
         logger.error(f"Error processing date {date}: {e}", exc_info=True)
         if date is not None:
             scraper.save_json(date)
+    finally:
+        WikiNewsScraper.SESSION.close()
 
 
 if __name__ == "__main__":
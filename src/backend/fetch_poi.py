@@ -1,34 +1,50 @@
-import copy
-import json
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import orjson
 from openai import OpenAI
 
 try:
     from . import config
-    from .utils import NewsItem, NewsPOI, NewsStatus, json_manager, logger
+    from .utils import (NewsItem, NewsPOI, NewsStatus, RateLimiter,
+                        json_manager, logger, poi_cache)
 except ImportError:
     import config
-    from utils import NewsItem, NewsPOI, NewsStatus, json_manager, logger
+    from utils import (NewsItem, NewsPOI, NewsStatus, RateLimiter,
+                       json_manager, logger, poi_cache)
+
+
+# Paces all language-model calls at one per REQUEST_INTERVAL across workers.
+_rate_limiter = RateLimiter(config.REQUEST_INTERVAL)
+
+# Matches a ```json ...``` (or bare ```) fence around the model's answer.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
 
 
 class AIChatter:
 
     PROMPT_FILE = Path(__file__).parent.parent.parent / "prompt.txt"
 
+    # One OpenAI client (and its underlying connection pool) shared across
+    # instances, so the weekly loop reuses warm TLS connections instead of
+    # handshaking once per day. Built lazily because the credentials come
+    # from the environment and may be absent at import time.
+    _client: OpenAI | None = None
+
     def __init__(
         self,
-        date: str = datetime.now().strftime("%Y-%m-%d"),
+        date: str | None = None,
         force_refresh: bool = False,
     ):
 
-        self.client = OpenAI(
-            base_url=config.LANGUAGE_MODEL_BASE_URL,
-            api_key=config.LANGUAGE_MODEL_API_KEY,
-        )
+        if AIChatter._client is None:
+            AIChatter._client = OpenAI(
+                base_url=config.LANGUAGE_MODEL_BASE_URL,
+                api_key=config.LANGUAGE_MODEL_API_KEY,
+            )
+        self.client = AIChatter._client
 
         try:
             with open(self.PROMPT_FILE, "r") as f:
@@ -40,17 +56,28 @@ class AIChatter:
             raise e
 
         self.force_refresh = force_refresh
-        self.date = date
+        # Resolved at construction, not import: a default argument would be
+        # frozen at module-load time and go stale after midnight.
+        self.date = date if date is not None else datetime.now().strftime(
+            "%Y-%m-%d")
 
     def get_news_list(self) -> None:
-        self.news_list = copy.deepcopy(json_manager.read_news_items(self.date))
+        self.news_list = json_manager.read_news_items(self.date)
+
+    # Statuses that still need a POI lookup when not force-refreshing.
+    PENDING_STATUSES = frozenset(
+        {NewsStatus.FETCHED, NewsStatus.POI_FETCH_FAILED})
 
     def request_for_poi(self, news_item: NewsItem) -> None:
-        if not self.force_refresh and news_item.status not in (
-            NewsStatus.FETCHED,
-            NewsStatus.POI_FETCH_FAILED,
-        ):
-            return
+        if not self.force_refresh:
+            cached_poi = poi_cache.get(news_item.description)
+            if cached_poi:
+                logger.info(
+                    f"POI cache hit for news item '{news_item.description[:config.LOG_DESCRIPTION_MAX_LENGTH]}...'"
+                )
+                news_item.poi = cached_poi
+                news_item.status = NewsStatus.POI_FETCHED
+                return
 
         for attempt in range(config.MAX_RETRIES):
 
@@ -60,6 +87,7 @@ class AIChatter:
                 )
 
             try:
+                _rate_limiter.acquire()
                 response = self.client.chat.completions.create(
                     model=config.LANGUAGE_MODEL_NAME,
                     messages=[
@@ -71,10 +99,6 @@ class AIChatter:
                     stream=False,
                     extra_body=config.LANGUAGE_MODEL_EXTRA_PARAMS,
                 )
-                logger.debug(
-                    f"Waiting for {config.REQUEST_INTERVAL} seconds after API calls."
-                )
-                time.sleep(config.REQUEST_INTERVAL)
                 answer_text = response.choices[0].message.content
             except Exception as e:
                 logger.error(
@@ -99,7 +123,7 @@ class AIChatter:
 
             try:
                 json_text = self.extract_json_text(answer_text)
-                poi_json = json.loads(json_text).get("poi")
+                poi_json = orjson.loads(json_text).get("poi")
 
                 if poi_json is None:
                     logger.warning(
@@ -132,12 +156,13 @@ class AIChatter:
 
                 news_item.poi = poi
                 news_item.status = NewsStatus.POI_FETCHED
+                poi_cache.set(news_item.description, poi)
                 logger.info(
                     f"Successfully fetched POI for news item '{news_item.description[:config.LOG_DESCRIPTION_MAX_LENGTH]}...'"
                 )
                 return
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(
                     f"JSON decode error for news item '{news_item.description[:config.LOG_DESCRIPTION_MAX_LENGTH]}...': {e}",
                     exc_info=True,
@@ -166,8 +191,7 @@ class AIChatter:
         return
 
     def extract_json_text(self, text: str) -> str:
-        pattern = r"```(?:json)?\s*(.*?)\s*```"
-        match = re.search(pattern, text, re.DOTALL)
+        match = _JSON_FENCE_RE.search(text)
         if match:
             return match.group(1)
         else:
@@ -177,14 +201,27 @@ class AIChatter:
         json_manager.write_news_items(self.news_list, self.date)
 
     def fetch_pois(self) -> None:
-        for i, news_item in enumerate(self.news_list):
-            self.request_for_poi(news_item)
+        targets = [
+            news_item for news_item in self.news_list
+            if self.force_refresh or news_item.status in self.PENDING_STATUSES
+        ]
+        if not targets:
+            logger.info(f"No news items need POI fetch for {self.date}.")
+            return
+        with ThreadPoolExecutor(max_workers=config.LLM_WORKERS) as executor:
+            futures = [
+                executor.submit(self.request_for_poi, news_item)
+                for news_item in targets
+            ]
+            for future in futures:
+                future.result()
 
     def work(self) -> None:
         logger.info(f"Starting POI fetch for date: {self.date}")
         self.get_news_list()
         self.fetch_pois()
         self.save_json()
+        poi_cache.save_cache()
         logger.info(f"Completed POI fetch for date: {self.date}")
 
 
@@ -209,6 +246,7 @@ def refresh_weekly_poi():
         if chatter is not None:
             chatter.save_json()
     finally:
+        poi_cache.save_cache()
         chatter = None
 
 
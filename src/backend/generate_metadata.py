@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import quote
@@ -67,12 +68,17 @@ def generate_sitemap() -> None:
         urls.append(("/", modtime))
 
         # Add public/news/*.json
+        # os.scandir reuses the stat data from the directory listing,
+        # unlike Path.glob + Path.stat which stat each entry again.
         news_dir = PUBLIC_DIR / "news"
         if news_dir.exists():
-            for json_file in news_dir.glob("*.json"):
-                modtime = datetime.fromtimestamp(
-                    json_file.stat().st_mtime, tz=timezone.utc)
-                urls.append((f"/news/{json_file.name}", modtime))
+            with os.scandir(news_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    modtime = datetime.fromtimestamp(
+                        entry.stat().st_mtime, tz=timezone.utc)
+                    urls.append((f"/news/{entry.name}", modtime))
 
         urlset = ElementTree.Element(
             "urlset", xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
@@ -1,12 +1,18 @@
 import copy
-import json
+import hashlib
+import logging
 import os
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
 import msgpack
+import orjson
+import requests
+from requests.adapters import HTTPAdapter, Retry
 
 try:
     from . import config
@@ -25,8 +31,49 @@ except Exception as e:
     raise
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket enforcing a minimum interval between requests,
+    so concurrent workers still respect a one-request-per-interval policy.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            if wait > 0:
+                time.sleep(wait)
+                now = time.monotonic()
+            self._next_time = max(self._next_time, now) + self.interval
+
+
+def build_session(headers: dict) -> requests.Session:
+    """
+    Builds a requests.Session with keep-alive pooling and retry/backoff,
+    so repeated calls against the same host reuse one warm connection.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=config.MAX_RETRIES,
+        backoff_factor=1,
+        status_forcelist=[429, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.headers.update(headers)
+    return session
+
+
 class NewsLink:
 
+    __slots__ = ("source", "url")
+
     def __init__(self, source: str, url: str):
         self.source = source
         self.url = url
@@ -34,6 +81,11 @@ class NewsLink:
 
 class NewsPOI:
 
+    __slots__ = ("country", "state", "city", "institution")
+
+    # Placeholder strings the model returns for fields it could not fill.
+    INVALID_VALUES = frozenset({"none", "n/a", "null", "unknown", ""})
+
     def __init__(
         self,
         country: str | None = None,
@@ -61,15 +113,16 @@ class NewsPOI:
         return ", ".join(part for part in parts if part)
 
     def __bool__(self) -> bool:
-        INVALID_VALUES = {"none", "n/a", "null", "unknown", ""}
-        for field in [self.country, self.state, self.city, self.institution]:
-            if field and field.strip().lower() not in INVALID_VALUES:
-                return True
-        return False
+        return any(
+            field and field.strip().lower() not in self.INVALID_VALUES
+            for field in (self.country, self.state, self.city, self.institution)
+        )
 
 
 class NewsCoordinate:
 
+    __slots__ = ("latitude", "longitude")
+
     def __init__(
         self,
         latitude: float | None = None,
@@ -92,8 +145,16 @@ class NewsStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# Status string -> member, bound once so the per-item lookup on file reads
+# is a single dict .get instead of a membership test plus Enum call.
+_STATUS_BY_VALUE = NewsStatus._value2member_map_
+
+
 class NewsItem:
 
+    __slots__ = ("status", "date", "description", "links", "poi",
+                 "coordinate")
+
     def __init__(
         self,
         status: NewsStatus,
@@ -107,14 +168,38 @@ class NewsItem:
         self.date = date
         self.description = description
         self.links = links
-        self.poi = copy.deepcopy(poi) if poi is not None else NewsPOI()
-        self.coordinate = copy.deepcopy(
-            coordinate) if coordinate is not None else NewsCoordinate()
+        # Callers hand over freshly built POI/coordinate objects, so the
+        # defensive deepcopy here only slowed down every file read.
+        self.poi = poi if poi is not None else NewsPOI()
+        self.coordinate = coordinate if coordinate is not None else NewsCoordinate()
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, NewsItem):
             return False
-        return self.description == other.description and self.date == other.date
+        # Compare the 10-char date before the potentially long description,
+        # so cross-date comparisons bail out cheaply.
+        return self.date == other.date and self.description == other.description
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status.value,
+            "date": self.date,
+            "description": self.description,
+            "links": [
+                {"source": link.source, "url": link.url}
+                for link in self.links
+            ],
+            "poi": {
+                "country": self.poi.country,
+                "state": self.poi.state,
+                "city": self.poi.city,
+                "institution": self.poi.institution,
+            },
+            "coordinate": {
+                "latitude": self.coordinate.latitude,
+                "longitude": self.coordinate.longitude,
+            },
+        }
 
     def is_similar(self, other: object) -> bool:
         if not isinstance(other, NewsItem):
@@ -123,11 +208,20 @@ class NewsItem:
             return False
         if self.date != other.date:
             return False
-        for self_link in self.links:
-            for other_link in other.links:
-                if self_link.url == other_link.url:
-                    return True
-        return False
+        # Set lookup keeps the shared-URL check linear instead of comparing
+        # every link pair. Not cached on the instance: links are replaced
+        # when a similar item is merged, which would leave a stale set.
+        self_urls = {self_link.url for self_link in self.links}
+        return any(other_link.url in self_urls for other_link in other.links)
+
+
+def _orjson_default(obj):
+    # Lets orjson walk the news list once, asking each item for its dict
+    # form on the fly instead of materializing a parallel list first.
+    if isinstance(obj, NewsItem):
+        return obj.to_dict()
+    raise TypeError(
+        f"Type is not JSON serializable: {type(obj).__name__}")
 
 
 class JSONManager:
@@ -138,6 +232,9 @@ class JSONManager:
     def __init__(self):
         try:
             os.makedirs(self.NEWS_FILE_DIR, exist_ok=True)
+            # Stringified once; _news_path then builds per-date paths with a
+            # plain f-string instead of os.path.join re-inspecting the Path.
+            self._news_dir = str(self.NEWS_FILE_DIR)
             logger.debug(
                 f"JSONManager initialized with news directory: {self.NEWS_FILE_DIR}")
         except Exception as e:
@@ -152,50 +249,34 @@ class JSONManager:
             logger.error(f"No news items to write for date: {date}.")
             return
 
-        json_path = os.path.join(self.NEWS_FILE_DIR, f"{date}.json")
+        json_path = self._news_path(date)
 
         try:
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    [
-                        {
-                            "status": news.status.value,
-                            "date": news.date,
-                            "description": news.description,
-                            "links": [
-                                {"source": link.source, "url": link.url}
-                                for link in news.links
-                            ],
-                            "poi": {
-                                "country": news.poi.country,
-                                "state": news.poi.state,
-                                "city": news.poi.city,
-                                "institution": news.poi.institution,
-                            },
-                            "coordinate": {
-                                "latitude": news.coordinate.latitude,
-                                "longitude": news.coordinate.longitude,
-                            },
-                        }
-                        for news in news_items
-                    ],
-                    f,
-                    ensure_ascii=False,
-                    indent=4,
-                )
-                logger.info(f"News items for {date} written to {json_path}")
+            # Compact output: these files are fetched by the map frontend,
+            # so indentation only inflated transfer size.
+            data = orjson.dumps(news_items, default=_orjson_default)
+            # Write to a sibling temp file and rename so a crash mid-write
+            # never leaves a truncated day file behind.
+            tmp_path = f"{json_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, json_path)
+            logger.info(f"News items for {date} written to {json_path}")
         except Exception as e:
             logger.error(
                 f"Error writing news items to {json_path}: {e}", exc_info=True)
 
+    def _news_path(self, date: str) -> str:
+        return f"{self._news_dir}{os.sep}{date}.json"
+
     def read_news_items(self, date: str) -> list[NewsItem]:
-        json_path = os.path.join(self.NEWS_FILE_DIR, f"{date}.json")
+        json_path = self._news_path(date)
         if not os.path.exists(json_path):
             logger.warning(f"No news file found for {date} at {json_path}")
             return list()
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_path, "rb") as f:
+                data = orjson.loads(f.read())
                 news_items = list()
                 for item in data:
                     links = [
@@ -204,21 +285,20 @@ class JSONManager:
                     ]
                     poi_data = item.get("poi", {})
                     poi = NewsPOI(
-                        country=poi_data.get("country"),
-                        state=poi_data.get("state"),
-                        city=poi_data.get("city"),
-                        institution=poi_data.get("institution"),
+                        poi_data.get("country"),
+                        poi_data.get("state"),
+                        poi_data.get("city"),
+                        poi_data.get("institution"),
                     )
                     coordinate_data = item.get("coordinate", {})
                     coordinate = NewsCoordinate(
-                        latitude=coordinate_data.get("latitude"),
-                        longitude=coordinate_data.get("longitude"),
+                        coordinate_data.get("latitude"),
+                        coordinate_data.get("longitude"),
                     )
-                    status_value = item.get("status")
-                    if status_value not in NewsStatus._value2member_map_:
-                        status_value = NewsStatus.UNKNOWN
+                    status = _STATUS_BY_VALUE.get(
+                        item.get("status"), NewsStatus.UNKNOWN)
                     news_item = NewsItem(
-                        status=NewsStatus(status_value),
+                        status=status,
                         date=item.get("date"),
                         description=item.get("description"),
                         links=links,
@@ -245,9 +325,11 @@ json_manager = JSONManager()
 
 class CoordinateEntry:
 
+    __slots__ = ("poi", "coordinate", "timestamp")
+
     def __init__(self, poi: NewsPOI, coordinate: NewsCoordinate, timestamp: datetime):
-        self.poi = copy.deepcopy(poi)
-        self.coordinate = copy.deepcopy(coordinate)
+        self.poi = poi
+        self.coordinate = coordinate
         self.timestamp = timestamp
 
     def __eq__(self, other: object) -> bool:
@@ -280,10 +362,24 @@ class CoordinateCacheManager:
             )
             raise
 
-        self.cache: list[CoordinateEntry] = list()
+        # Entries keyed by the canonical POI tuple, so lookups and
+        # duplicate checks are dict hits instead of list scans.
+        self.cache: dict[tuple, CoordinateEntry] = dict()
+        # Guards cache mutations when coordinate lookups run on worker threads.
+        self._lock = threading.Lock()
+        self._dirty = False
         self.load_cache()
         self.clean()
 
+    @staticmethod
+    def _poi_key(poi: NewsPOI) -> tuple:
+        # Canonical cache key: case and surrounding whitespace differences in
+        # LLM-extracted fields should not cause separate cache entries.
+        return tuple(
+            (field or "").strip().casefold()
+            for field in (poi.country, poi.state, poi.city, poi.institution)
+        )
+
     @staticmethod
     def _entry_to_data(entry: CoordinateEntry) -> dict:
         return {
@@ -340,7 +436,7 @@ class CoordinateCacheManager:
                 entry = self._data_to_entry(
                     item if isinstance(item, dict) else {})
                 if entry:
-                    self.cache.append(entry)
+                    self.cache[self._poi_key(entry.poi)] = entry
 
             logger.info(
                 f"Loaded coordinate cache with {len(self.cache)} entries from {self.CACHE_FILE_PATH}"
@@ -349,20 +445,30 @@ class CoordinateCacheManager:
             logger.error(
                 f"Error loading coordinate cache: {e}", exc_info=True
             )
-            self.cache = list()
+            self.cache = dict()
 
     def save_cache(self) -> None:
-        try:
-            data = [self._entry_to_data(entry) for entry in self.cache]
-            with open(self.CACHE_FILE_PATH, "wb") as f:
-                msgpack.pack(data, f, use_bin_type=True)
-            logger.info(
-                f"Saved coordinate cache with {len(self.cache)} entries to {self.CACHE_FILE_PATH}"
-            )
-        except Exception as e:
-            logger.error(
-                f"Error saving coordinate cache to {self.CACHE_FILE_PATH}: {e}", exc_info=True
-            )
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                data = msgpack.packb(
+                    [self._entry_to_data(entry)
+                     for entry in self.cache.values()],
+                    use_bin_type=True,
+                )
+                tmp_path = f"{self.CACHE_FILE_PATH}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.CACHE_FILE_PATH)
+                self._dirty = False
+                logger.info(
+                    f"Saved coordinate cache with {len(self.cache)} entries to {self.CACHE_FILE_PATH}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error saving coordinate cache to {self.CACHE_FILE_PATH}: {e}", exc_info=True
+                )
 
     def clean(self) -> None:
         if not self.cache:
@@ -371,16 +477,17 @@ class CoordinateCacheManager:
         logger.info("Cleaning expired coordinate cache...")
         expire_threshold = datetime.now() - timedelta(days=self.EXPIRATION_DAYS)
         original_count = len(self.cache)
-        self.cache = [
-            entry for entry in self.cache
+        self.cache = {
+            key: entry for key, entry in self.cache.items()
             if entry and entry.timestamp >= expire_threshold
-        ]
+        }
         cleaned_count = original_count - len(self.cache)
 
         if cleaned_count > 0:
             logger.info(
                 f"Cleaned {cleaned_count} expired entries from coordinate cache"
             )
+            self._dirty = True
             self.save_cache()
         else:
             logger.info("No expired entries found in coordinate cache")
@@ -391,37 +498,246 @@ class CoordinateCacheManager:
                 f"Attempted to insert invalid coordinate entry for POI {str(entry.poi)}, skipping"
             )
             return
-        if entry in self.cache:
-            if not force_refresh:
-                logger.debug(
-                    f"Coordinate entry for POI {str(entry)} already exists in cache, skipping insert"
-                )
-                return
-            else:
+        key = self._poi_key(entry.poi)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        with self._lock:
+            if key in self.cache:
+                if not force_refresh:
+                    if debug_enabled:
+                        logger.debug(
+                            f"Coordinate entry for POI {str(entry)} already exists in cache, skipping insert"
+                        )
+                    return
+                if debug_enabled:
+                    logger.debug(
+                        f"Force refreshing coordinate entry for POI {str(entry)}, replacing old entry"
+                    )
+            elif debug_enabled:
                 logger.debug(
-                    f"Force refreshing coordinate entry for POI {str(entry)}, removing old entry"
+                    f"Inserted new coordinate entry for POI {str(entry)} into cache"
                 )
-                self.cache = [e for e in self.cache if e != entry]
-                self.cache.append(entry)
-                self.save_cache()
-
-        self.cache.append(entry)
-        logger.debug(
-            f"Inserted new coordinate entry for POI {str(entry)} into cache"
-        )
-        self.save_cache()
+            self.cache[key] = entry
+            self._dirty = True
 
     def select_coordinate(self, poi: NewsPOI) -> NewsCoordinate | None:
         if not poi:
             return None
-        for entry in self.cache:
-            if entry.poi == poi:
+        key = self._poi_key(poi)
+        with self._lock:
+            entry = self.cache.get(key)
+        # str(poi) is not free, so only build these messages when DEBUG
+        # actually passes the level filter; this runs once per lookup.
+        if entry is not None:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"Cache hit for POI {str(poi)}, returning cached coordinates"
                 )
-                return copy.deepcopy(entry.coordinate)
-        logger.debug(f"Cache miss for POI {str(poi)}")
+            return copy.deepcopy(entry.coordinate)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache miss for POI {str(poi)}")
         return None
 
 
 cache_manager = CoordinateCacheManager()
+
+
+class NominatimResponseCache:
+    """
+    Persists raw Nominatim responses keyed by request URL, so fallback
+    queries that resolved to nothing usable (0-result or ambiguous replies)
+    are not re-issued on later runs. Entries expire on the same schedule
+    as the coordinate cache.
+    """
+
+    EXPIRATION_DAYS = max(config.CACHE_EXPIRATION_DAYS, 7)
+    CACHE_FILE_PATH = CoordinateCacheManager.CACHE_FILE_DIR / "responses.msgpack"
+
+    def __init__(self):
+        self.cache: dict[str, dict] = dict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        try:
+            os.makedirs(self.CACHE_FILE_PATH.parent, exist_ok=True)
+        except Exception as e:
+            logger.error(
+                f"Error creating cache directory {self.CACHE_FILE_PATH.parent}: {e}", exc_info=True
+            )
+            raise
+
+        self.load_cache()
+
+    def load_cache(self) -> None:
+        if not self.CACHE_FILE_PATH.exists():
+            return
+
+        try:
+            with open(self.CACHE_FILE_PATH, "rb") as f:
+                packed_cache = msgpack.unpack(f, raw=False)
+
+            if not isinstance(packed_cache, dict):
+                raise ValueError("Invalid response cache format: expected dict")
+
+            expire_threshold = datetime.now() - timedelta(days=self.EXPIRATION_DAYS)
+            for url, record in packed_cache.items():
+                try:
+                    timestamp = datetime.fromisoformat(record["timestamp"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if timestamp >= expire_threshold:
+                    self.cache[url] = record
+
+            logger.info(
+                f"Loaded response cache with {len(self.cache)} entries from {self.CACHE_FILE_PATH}"
+            )
+        except Exception as e:
+            logger.error(
+                f"Error loading response cache: {e}", exc_info=True
+            )
+            self.cache = dict()
+
+    def save_cache(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                data = msgpack.packb(self.cache, use_bin_type=True)
+                tmp_path = f"{self.CACHE_FILE_PATH}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.CACHE_FILE_PATH)
+                self._dirty = False
+                logger.info(
+                    f"Saved response cache with {len(self.cache)} entries to {self.CACHE_FILE_PATH}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error saving response cache to {self.CACHE_FILE_PATH}: {e}", exc_info=True
+                )
+
+    def get(self, url: str) -> list | None:
+        with self._lock:
+            record = self.cache.get(url)
+        if record is None:
+            return None
+        return record.get("data")
+
+    def set(self, url: str, data: list) -> None:
+        with self._lock:
+            self.cache[url] = {
+                "timestamp": datetime.now().isoformat(),
+                "data": data,
+            }
+            self._dirty = True
+
+
+response_cache = NominatimResponseCache()
+
+
+class POICacheManager:
+    """
+    Persists extracted POIs keyed by a hash of the news description, so
+    descriptions that recur across the 7-day window (Wikipedia carries
+    items over between days) skip the language-model call entirely.
+    """
+
+    EXPIRATION_DAYS = max(config.CACHE_EXPIRATION_DAYS, 7)
+    CACHE_FILE_PATH = CoordinateCacheManager.CACHE_FILE_DIR / "poi.msgpack"
+
+    def __init__(self):
+        self.cache: dict[str, dict] = dict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        try:
+            os.makedirs(self.CACHE_FILE_PATH.parent, exist_ok=True)
+        except Exception as e:
+            logger.error(
+                f"Error creating cache directory {self.CACHE_FILE_PATH.parent}: {e}", exc_info=True
+            )
+            raise
+
+        self.load_cache()
+
+    @staticmethod
+    def _description_key(description: str) -> str:
+        return hashlib.sha256(description.strip().encode()).hexdigest()
+
+    def load_cache(self) -> None:
+        if not self.CACHE_FILE_PATH.exists():
+            return
+
+        try:
+            with open(self.CACHE_FILE_PATH, "rb") as f:
+                packed_cache = msgpack.unpack(f, raw=False)
+
+            if not isinstance(packed_cache, dict):
+                raise ValueError("Invalid POI cache format: expected dict")
+
+            expire_threshold = datetime.now() - timedelta(days=self.EXPIRATION_DAYS)
+            for key, record in packed_cache.items():
+                try:
+                    timestamp = datetime.fromisoformat(record["timestamp"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if timestamp >= expire_threshold:
+                    self.cache[key] = record
+
+            logger.info(
+                f"Loaded POI cache with {len(self.cache)} entries from {self.CACHE_FILE_PATH}"
+            )
+        except Exception as e:
+            logger.error(
+                f"Error loading POI cache: {e}", exc_info=True
+            )
+            self.cache = dict()
+
+    def save_cache(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                data = msgpack.packb(self.cache, use_bin_type=True)
+                tmp_path = f"{self.CACHE_FILE_PATH}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.CACHE_FILE_PATH)
+                self._dirty = False
+                logger.info(
+                    f"Saved POI cache with {len(self.cache)} entries to {self.CACHE_FILE_PATH}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error saving POI cache to {self.CACHE_FILE_PATH}: {e}", exc_info=True
+                )
+
+    def get(self, description: str) -> NewsPOI | None:
+        key = self._description_key(description)
+        with self._lock:
+            record = self.cache.get(key)
+        if record is None:
+            return None
+        poi_data = record.get("poi", {})
+        return NewsPOI(
+            country=poi_data.get("country"),
+            state=poi_data.get("state"),
+            city=poi_data.get("city"),
+            institution=poi_data.get("institution"),
+        )
+
+    def set(self, description: str, poi: NewsPOI) -> None:
+        key = self._description_key(description)
+        with self._lock:
+            self.cache[key] = {
+                "timestamp": datetime.now().isoformat(),
+                "poi": {
+                    "country": poi.country,
+                    "state": poi.state,
+                    "city": poi.city,
+                    "institution": poi.institution,
+                },
+            }
+            self._dirty = True
+
+
+poi_cache = POICacheManager()
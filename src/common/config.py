@@ -1,19 +1,37 @@
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# The C loader needs libyaml at build time; fall back to the pure-Python
+# SafeLoader where it is unavailable.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 current_file = Path(__file__).resolve()
-backend_dir = current_file.parent
-src_dir = backend_dir.parent
+common_dir = current_file.parent
+src_dir = common_dir.parent
 project_root = src_dir.parent
 config_yaml_path = project_root / "config.yaml"
 
-try:
-    with open(config_yaml_path, "r") as f:
-        config = yaml.safe_load(f)
-except Exception as e:
-    print(f"Error loading config.yaml: {e}")
-    raise
+
+@lru_cache(maxsize=1)
+def load_config() -> dict:
+    """
+    Loads and parses config.yaml once per process; every importer shares
+    the cached result instead of re-reading the file.
+    """
+    try:
+        with open(config_yaml_path, "r") as f:
+            return yaml.load(f, Loader=_YamlLoader)
+    except Exception as e:
+        print(f"Error loading config.yaml: {e}")
+        raise
+
+
+config = load_config()
 
 
 # Logging configuration
@@ -1,5 +1,9 @@
+import atexit
 import logging
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 try:
@@ -41,15 +45,32 @@ class Logger:
         self._log_type_filter = self._LogTypeFilter(log_type)
         self.logger.addFilter(self._log_type_filter)
 
+        # Callers only pay for enqueueing a record; formatting and file I/O
+        # happen on the listener's background thread.
+        self._queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(self._queue))
+        self._listener = None
+        self._file_handler = None
+
         self.log_dir = Path(__file__).parent.parent.parent / "logs" / log_type
         self.formatter = logging.Formatter(
             "%(asctime)s - [%(log_type)s] - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         self.last_log_path = None
+        # Ordinal of the day the current file handler was built for; lets
+        # _log skip the strftime/Path work on every call (see _setup_handlers).
+        self._last_day = None
+        # Serializes the rollover swap: worker threads log concurrently, and
+        # two of them stopping/starting the same listener would race.
+        self._rollover_lock = threading.Lock()
+
+        self._console_handler = logging.StreamHandler()
+        self._console_handler.setFormatter(self.formatter)
 
         self._ensure_log_dir_exists()
         self._setup_handlers()
+        atexit.register(self.close)
 
     def _ensure_log_dir_exists(self):
         try:
@@ -64,36 +85,56 @@ class Logger:
         return self.log_dir / f"{today}.log"
 
     def _setup_handlers(self):
-        current_log_path = self._get_today_log_path()
-
-        if self.last_log_path == current_log_path:
+        # Runs on every log call to catch day rollover; comparing the day
+        # ordinal is much cheaper than formatting the date and building a
+        # Path just to conclude nothing changed.
+        day = datetime.now().toordinal()
+        if day == self._last_day:
             return
 
-        for handler in list(self.logger.handlers):
-            if isinstance(handler, logging.FileHandler):
-                self.logger.removeHandler(handler)
-                handler.close()
-
-        try:
-            new_file_handler = logging.FileHandler(
-                str(current_log_path),
-                encoding="utf-8"
-            )
-            new_file_handler.setFormatter(self.formatter)
-            self.logger.addHandler(new_file_handler)
+        # Double-checked under the lock: several worker threads can reach
+        # here at once on rollover, and only one may swap the listener.
+        with self._rollover_lock:
+            if day == self._last_day:
+                return
+
+            current_log_path = self._get_today_log_path()
+
+            try:
+                new_file_handler = logging.FileHandler(
+                    str(current_log_path),
+                    encoding="utf-8"
+                )
+                new_file_handler.setFormatter(self.formatter)
+            except Exception as e:
+                print(
+                    f"Failed to create file handler for {current_log_path.absolute()}: {e}")
+                raise
+
+            # On day rollover, drain the old listener before swapping in a
+            # listener bound to the new day's file.
+            if self._listener is not None:
+                self._listener.stop()
+            if self._file_handler is not None:
+                self._file_handler.close()
+
+            self._file_handler = new_file_handler
+            self._listener = QueueListener(
+                self._queue, new_file_handler, self._console_handler)
+            self._listener.start()
             self.last_log_path = current_log_path
-        except Exception as e:
-            print(
-                f"Failed to create file handler for {current_log_path.absolute()}: {e}")
-            raise
-
-        has_console_handler = any(isinstance(
-            h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
-            for h in self.logger.handlers)
-        if not has_console_handler:
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(self.formatter)
-            self.logger.addHandler(console_handler)
+            self._last_day = day
+
+    def close(self):
+        # Flushes queued records through the listener; registered with
+        # atexit so nothing is lost on interpreter shutdown.
+        with self._rollover_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            if self._file_handler is not None:
+                self._file_handler.close()
+                self._file_handler = None
 
     def _log(self, level, msg, exc_info=False):
         self._setup_handlers()
@@ -108,6 +149,11 @@ class Logger:
         elif level == logging.CRITICAL:
             self.logger.critical(msg)
 
+    def isEnabledFor(self, level: int) -> bool:
+        # Lets callers skip building expensive log messages (f-strings over
+        # __str__-heavy objects) when the level is filtered out anyway.
+        return self.logger.isEnabledFor(level)
+
     def debug(self, msg):
         self._log(logging.DEBUG, msg)
 